@@ -18,10 +18,9 @@ import json
 import logging
 from pprint import pformat
 
-import boto3
-
 from ..consts import DEFAULT_ELB_SECURITYGROUPS
-from ..utils import get_properties, get_subnets, get_template, get_vpc_id, remove_duplicate_sg, wait_for_task
+from ..utils import (get_boto3_client, get_properties, get_subnets, get_template, get_vpc_id, remove_duplicate_sg,
+                     wait_for_task)
 from .format_listeners import format_listeners
 from .splay_health import splay_health
 
@@ -132,8 +131,7 @@ class SpinnakerELB:
         Args:
             json_data (json): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto3_client('elb', env=self.env, region=self.region)
 
         # create stickiness policy if set in configs
         stickiness = {}
@@ -166,8 +164,7 @@ class SpinnakerELB:
         Args:
             json_data (json): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto3_client('elb', env=self.env, region=self.region)
 
         # Attach backend server policies to created ELB
         for job in json.loads(json_data)['job']:
@@ -191,8 +188,7 @@ class SpinnakerELB:
                 }
         """
         stickiness_dict = {}
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto3_client('elb', env=self.env, region=self.region)
         elb_settings = self.properties['elb']
         for listener in elb_settings.get('ports'):
             if listener.get("stickiness"):
@@ -223,8 +219,7 @@ class SpinnakerELB:
         Args:
             json_data (json): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto3_client('elb', env=self.env, region=self.region)
 
         elb_settings = self.properties['elb']
         LOG.debug('Block ELB Settings Pre Configure Load Balancer Attributes:\n%s', pformat(elb_settings))
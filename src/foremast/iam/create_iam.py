@@ -17,9 +17,7 @@
 import collections
 import logging
 
-import boto3
-
-from ..utils import get_details, get_properties, get_template
+from ..utils import get_boto3_client, get_details, get_properties, get_template
 from .construct_policy import construct_policy
 from .resource_action import resource_action
 
@@ -36,8 +34,7 @@ def create_iam_resources(env='dev', app='', **_):
     Returns:
         True upon successful completion.
     """
-    session = boto3.session.Session(profile_name=env)
-    client = session.client('iam')
+    client = get_boto3_client('iam', env=env)
 
     app_properties = get_properties(env='pipeline')
 
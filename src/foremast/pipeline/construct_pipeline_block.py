@@ -130,7 +130,8 @@ def construct_pipeline_block(env='',
 
     """
     LOG.info('%s block for [%s].', env, region)
-    LOG.debug('%s info:\n%s', env, pformat(settings))
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug('%s info:\n%s', env, pformat(settings))
 
     pipeline_type = pipeline_data['type']
 
@@ -162,7 +163,8 @@ def construct_pipeline_block(env='',
         'pipeline': pipeline_data,
     })
 
-    LOG.debug('Block data:\n%s', pformat(data))
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug('Block data:\n%s', pformat(data))
 
     template_name = get_template_name(env, pipeline_type)
     pipeline_json = get_template(template_file=template_name, data=data, formats=generated, **kwargs)
@@ -14,19 +14,23 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Create Pipelines for Spinnaker."""
-import collections
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pprint import pformat
 
-from ..consts import DEFAULT_RUN_AS_USER, EC2_PIPELINE_TYPES
+import foremastutils
+
+from ..consts import APP_FORMATS, DEFAULT_RUN_AS_USER, EC2_PIPELINE_TYPES
 from ..exceptions import SpinnakerPipelineCreationFailed
 from ..utils import ami_lookup, generate_packer_filename, get_details, get_properties, get_subnets, get_template
 from ..utils.gate import gate_request
 from .clean_pipelines import clean_pipelines
 from .construct_pipeline_block import construct_pipeline_block
-from .renumerate_stages import renumerate_stages
+from .renumerate_stages import StageRenumerator
+
+MAX_REGION_WORKERS = 8
 
 
 class SpinnakerPipeline:
@@ -44,7 +48,6 @@ class SpinnakerPipeline:
         self.log = logging.getLogger(__name__)
 
         self.header = {'content-type': 'application/json'}
-        self.here = os.path.dirname(os.path.realpath(__file__))
 
         self.runway_dir = os.path.expandvars(os.path.expanduser(runway_dir or ''))
 
@@ -62,16 +65,15 @@ class SpinnakerPipeline:
         """Send Pipeline JSON to Spinnaker.
 
         Args:
-            pipeline (json): json of the pipeline to be created in Spinnaker
+            pipeline (dict, str): New Pipeline to create.
         """
         uri = '/pipelines'
 
         if isinstance(pipeline, str):
             pipeline_json = pipeline
+            pipeline = json.loads(pipeline_json)
         else:
-            pipeline_json = json.dumps(pipeline)
-
-        pipeline_dict = json.loads(pipeline_json)
+            pipeline_json = json.dumps(pipeline, separators=(',', ':'))
 
         self.log.debug('Pipeline JSON:\n%s', pipeline_json)
 
@@ -83,32 +85,38 @@ class SpinnakerPipeline:
             raise SpinnakerPipelineCreationFailed('Pipeline for {0}: {1}'.format(self.app_name,
                                                                                  pipeline_response.json()))
 
-        self.log.info('Successfully created "%s" pipeline in application "%s".', pipeline_dict['name'],
-                      pipeline_dict['application'])
+        self.log.info('Successfully created "%s" pipeline in application "%s".', pipeline['name'],
+                      pipeline['application'])
 
-    def render_wrapper(self, region='us-east-1'):
+    def render_wrapper(self, region='us-east-1', generated=None):
         """Generate the base Pipeline wrapper.
 
         This renders the non-repeatable stages in a pipeline, like jenkins, baking, tagging and notifications.
 
         Args:
             region (str): AWS Region.
+            generated (foremastutils.Generator): Naming formats for _region_,
+                defaults to :attr:`generated`.
 
         Returns:
             dict: Rendered Pipeline wrapper.
 
         """
-        base = self.settings['pipeline']['base']
+        pipeline_settings = self.settings['pipeline']
+        notifications = pipeline_settings['notifications']
+        image = pipeline_settings['image']
+
+        base = pipeline_settings['base']
 
         if self.base:
             base = self.base
 
-        email = self.settings['pipeline']['notifications']['email']
-        slack = self.settings['pipeline']['notifications']['slack']
-        baking_process = self.settings['pipeline']['image']['builder']
+        email = notifications['email']
+        slack = notifications['slack']
+        baking_process = image['builder']
         provider = 'aws'
-        root_volume_size = self.settings['pipeline']['image']['root_volume_size']
-        bake_instance_type = self.settings['pipeline']['image']['bake_instance_type']
+        root_volume_size = image['root_volume_size']
+        bake_instance_type = image['bake_instance_type']
 
         ami_id = ami_lookup(name=base, region=region)
 
@@ -132,14 +140,17 @@ class SpinnakerPipeline:
                 'root_volume_size': root_volume_size,
                 'bake_instance_type': bake_instance_type,
                 'ami_template_file': ami_template_file,
-                'pipeline': self.settings['pipeline']
+                'pipeline': pipeline_settings
             },
             'id': pipeline_id
         }
 
-        self.log.debug('Wrapper app data:\n%s', pformat(data))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug('Wrapper app data:\n%s', pformat(data))
 
-        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
+        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2',
+                               data=data,
+                               formats=generated or self.generated)
 
         return json.loads(wrapper)
 
@@ -188,70 +199,126 @@ class SpinnakerPipeline:
 
         return pipeline_id
 
+    def _region_generator(self, region):
+        """Generate naming formats private to a single Region.
+
+        Args:
+            region (str): AWS Region.
+
+        Returns:
+            foremastutils.Generator: Naming formats for _region_.
+
+        """
+        data = self.generated.data
+        return foremastutils.Generator(
+            data['raw_project'], data['raw_repo'], env=data['env'], region=region, formats=APP_FORMATS)
+
+    def _build_and_post_region(self, region, envs, subnets=None):
+        """Assemble the Pipeline for a single Region and send it to Spinnaker.
+
+        Runs in a worker thread of :meth:`create_pipeline`, so it works on its
+        own naming formats rather than updating :attr:`generated`.
+
+        Args:
+            region (str): AWS Region.
+            envs (list): Environments deploying to _region_, in promotion order.
+            subnets (dict): Subnets from :func:`foremast.utils.get_subnets`.
+
+        Returns:
+            tuple: _region_ and the Pipeline sent to Spinnaker.
+
+        """
+        generated = self._region_generator(region)
+
+        # TODO: Overrides for an environment no longer makes sense. Need to
+        # provide override for entire Region possibly.
+        pipeline = self.render_wrapper(region=region, generated=generated)
+
+        renumerator = StageRenumerator()
+        renumerator.renumerate(pipeline['stages'])
+
+        is_ec2 = self.settings['pipeline']['type'] in EC2_PIPELINE_TYPES
+
+        previous_env = None
+        for env in envs:
+            generated.data.update({
+                'env': env,
+            })
+
+            pipeline_block_data = {
+                "env": env,
+                "generated": generated,
+                "previous_env": previous_env,
+                "region": region,
+                "settings": self.settings[env][region],
+                "pipeline_data": self.settings['pipeline'],
+            }
+
+            if is_ec2:
+                if region not in subnets.get(env, {}):
+                    self.log.info('%s is not available for %s.', env, region)
+                    continue
+                pipeline_block_data['region_subnets'] = {region: subnets[env][region]}
+
+            block = construct_pipeline_block(**pipeline_block_data)
+            pipeline['stages'].extend(renumerator.renumerate(json.loads(block)))
+            previous_env = env
+
+        self.post_pipeline(pipeline)
+
+        return region, pipeline
+
     def create_pipeline(self):
         """Main wrapper for pipeline creation.
         1. Runs clean_pipelines to clean up existing ones
         2. determines which environments the pipeline needs
         3. gets all subnets for template rendering
-        4. Renders all of the pipeline blocks as defined in configs
+        4. Renders all of the pipeline blocks as defined in configs, one
+           Region per worker thread
         5. Runs post_pipeline to create pipeline
+
+        Regions are independent, so one Region failing does not stop the
+        others from being posted. Every failure is logged before raising.
+
+        Raises:
+            SpinnakerPipelineCreationFailed: One or more Regions failed.
         """
         clean_pipelines(app=self.app_name, settings=self.settings)
 
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
 
-        regions_envs = collections.defaultdict(list)
+        regions_envs = {}
         for env in pipeline_envs:
             for region in self.settings[env]['regions']:
-                regions_envs[region].append(env)
-        self.log.info('Environments and Regions for Pipelines:\n%s', json.dumps(regions_envs, indent=4))
+                regions_envs.setdefault(region, []).append(env)
+        self.log.info('Environments and Regions for Pipelines: %s', regions_envs)
 
         subnets = None
-        pipelines = {}
-        for region, envs in regions_envs.items():
-            self.generated.data.update({
-                'region': region,
-            })
+        if self.settings['pipeline']['type'] in EC2_PIPELINE_TYPES:
+            subnets = get_subnets()
 
-            # TODO: Overrides for an environment no longer makes sense. Need to
-            # provide override for entire Region possibly.
-            pipelines[region] = self.render_wrapper(region=region)
-
-            previous_env = None
-            for env in envs:
-                self.generated.data.update({
-                    'env': env,
-                })
-
-                pipeline_block_data = {
-                    "env": env,
-                    "generated": self.generated,
-                    "previous_env": previous_env,
-                    "region": region,
-                    "settings": self.settings[env][region],
-                    "pipeline_data": self.settings['pipeline'],
-                }
-
-                if self.settings['pipeline']['type'] in EC2_PIPELINE_TYPES:
-                    if not subnets:
-                        subnets = get_subnets()
-                    try:
-                        region_subnets = {region: subnets[env][region]}
-                    except KeyError:
-                        self.log.info('%s is not available for %s.', env, region)
-                        continue
-                    pipeline_block_data['region_subnets'] = region_subnets
-
-                block = construct_pipeline_block(**pipeline_block_data)
-                pipelines[region]['stages'].extend(json.loads(block))
-                previous_env = env
-
-        self.log.debug('Assembled Pipelines:\n%s', pformat(pipelines))
-
-        for region, pipeline in pipelines.items():
-            renumerate_stages(pipeline)
-
-            self.post_pipeline(pipeline)
+        pipelines = {}
+        failed_regions = []
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_REGION_WORKERS, len(regions_envs)))) as executor:
+            futures = {
+                executor.submit(self._build_and_post_region, region, envs, subnets): region
+                for region, envs in regions_envs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    region, pipeline = future.result()
+                except Exception:  # pylint: disable=broad-except
+                    self.log.exception('Error creating Pipeline for %s', futures[future])
+                    failed_regions.append(futures[future])
+                else:
+                    pipelines[region] = pipeline
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug('Assembled Pipelines:\n%s', pformat(pipelines))
+
+        if failed_regions:
+            raise SpinnakerPipelineCreationFailed('Failed to create Pipelines for {0}: {1}'.format(
+                self.app_name, ', '.join(sorted(failed_regions))))
 
         return True
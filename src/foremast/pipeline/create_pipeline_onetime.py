@@ -17,6 +17,7 @@
 
 These are circumventions for redployments to a specific Environment in a Region.
 """
+import copy
 import json
 
 from .create_pipeline import SpinnakerPipeline
@@ -49,11 +50,9 @@ class SpinnakerPipelineOnetime(SpinnakerPipeline):
             pipeline (dict, str): New Pipeline to create.
         """
         if isinstance(pipeline, str):
-            pipeline_str = pipeline
+            pipeline_json = json.loads(pipeline)
         else:
-            pipeline_str = json.dumps(pipeline)
-
-        pipeline_json = json.loads(pipeline_str)
+            pipeline_json = copy.deepcopy(pipeline)
 
         # Note pipeline name is manual
         name = '{0} (onetime-{1})'.format(pipeline_json['name'], self.environments[0])
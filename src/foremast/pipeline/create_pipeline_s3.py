@@ -14,7 +14,6 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Create Pipelines for Spinnaker."""
-import collections
 import json
 from pprint import pformat
 
@@ -93,10 +92,10 @@ class SpinnakerPipelineS3(SpinnakerPipeline):
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
 
-        regions_envs = collections.defaultdict(list)
+        regions_envs = {}
         for env in pipeline_envs:
             for region in self.settings[env]['regions']:
-                regions_envs[region].append(env)
+                regions_envs.setdefault(region, []).append(env)
         self.log.info('Environments and Regions for Pipelines:\n%s', json.dumps(regions_envs, indent=4))
 
         pipelines = {}
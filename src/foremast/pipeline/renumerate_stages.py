@@ -35,34 +35,54 @@ def renumerate_stages(pipeline):
     Returns:
         dict: Pipeline ready to be sent to Spinnaker.
     """
-    stages = pipeline['stages']
-
-    main_index = 0
-    branch_index = 0
-    previous_refid = ''
-
-    for stage in stages:
-        current_refid = stage['refId'].lower()
-        if current_refid == 'master':
-            if main_index == 0:
-                stage['requisiteStageRefIds'] = []
-            else:
-                stage['requisiteStageRefIds'] = [str(main_index)]
-            main_index += 1
-            stage['refId'] = str(main_index)
-        elif current_refid == 'branch':
-            # increments a branch_index to account for multiple parrallel stages
-            if previous_refid == 'branch':
-                branch_index += 1
-            else:
-                branch_index = 0
-            stage['refId'] = str((main_index * 100) + branch_index)
-            stage['requisiteStageRefIds'] = [str(main_index)]
-        elif current_refid == 'merge':
-            # TODO: Added logic to handle merge stages.
-            pass
-
-        previous_refid = current_refid
-        LOG.debug('step=%(name)s\trefId=%(refId)s\t' 'requisiteStageRefIds=%(requisiteStageRefIds)s', stage)
-
+    StageRenumerator().renumerate(pipeline['stages'])
     return pipeline
+
+
+class StageRenumerator:
+    """Renumber Stages incrementally as a Pipeline is assembled.
+
+    Numbering only depends on the Stages seen so far, so each block of Stages
+    can be numbered as it is added instead of walking the finished Pipeline
+    again. See :func:`renumerate_stages` for the ``refId`` rules.
+    """
+
+    def __init__(self):
+        self.main_index = 0
+        self.branch_index = 0
+        self.previous_refid = ''
+
+    def renumerate(self, stages):
+        """Renumber _stages_ in place, continuing from previous calls.
+
+        Args:
+            stages (list): Stages following those already renumbered.
+
+        Returns:
+            list: _stages_ with numbered ``refId`` and ``requisiteStageRefIds``.
+        """
+        for stage in stages:
+            current_refid = stage['refId'].lower()
+            if current_refid == 'master':
+                if self.main_index == 0:
+                    stage['requisiteStageRefIds'] = []
+                else:
+                    stage['requisiteStageRefIds'] = [str(self.main_index)]
+                self.main_index += 1
+                stage['refId'] = str(self.main_index)
+            elif current_refid == 'branch':
+                # increments a branch_index to account for multiple parrallel stages
+                if self.previous_refid == 'branch':
+                    self.branch_index += 1
+                else:
+                    self.branch_index = 0
+                stage['refId'] = str((self.main_index * 100) + self.branch_index)
+                stage['requisiteStageRefIds'] = [str(self.main_index)]
+            elif current_refid == 'merge':
+                # TODO: Added logic to handle merge stages.
+                pass
+
+            self.previous_refid = current_refid
+            LOG.debug('step=%(name)s\trefId=%(refId)s\t' 'requisiteStageRefIds=%(requisiteStageRefIds)s', stage)
+
+        return stages
@@ -29,6 +29,9 @@ Then run specific prepare jobs.
 import argparse
 import logging
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 import foremastutils
 
@@ -39,24 +42,40 @@ from .app import SpinnakerApp
 from .args import add_debug
 from .cloudfunction.cloud_functions_client import CloudFunctionsClient
 from .exceptions import ForemastError
+from .pipeline.create_pipeline import MAX_REGION_WORKERS
+from .utils.gate import GATE_POOL_MAXSIZE
 from .utils.gcp_environment import GcpEnvironment
 from tabulate import tabulate
 
 LOG = logging.getLogger(__name__)
 
+# Each rebuild worker posts up to MAX_REGION_WORKERS Region pipelines at once,
+# so a rebuild keeps at most GATE_POOL_MAXSIZE requests in flight against Gate
+# and every one of them reuses a pooled connection.
+REBUILD_WORKERS = max(1, GATE_POOL_MAXSIZE // MAX_REGION_WORKERS)
+_LOGGING_CONFIGURED = False
+
 
 class ForemastRunner:
     """Wrap each pipes module in a way that is easy to invoke."""
 
-    def __init__(self):
-        """Setup the Runner for all Foremast modules."""
+    RAW_PATH = "./raw.properties"
+
+    def __init__(self, group=None, repo=None, raw_path=RAW_PATH):
+        """Setup the Runner for all Foremast modules.
+
+        Args:
+            group (str): Git project of the application, defaults to $PROJECT.
+            repo (str): Git repository of the application, defaults to $GIT_REPO.
+            raw_path (str): Path to write generated configurations to.
+        """
         debug_flag()
 
         self.email = os.getenv("EMAIL")
         self.env = os.getenv("ENV")
-        self.group = os.getenv("PROJECT")
+        self.group = group or os.getenv("PROJECT")
         self.region = os.getenv("REGION")
-        self.repo = os.getenv("GIT_REPO")
+        self.repo = repo or os.getenv("GIT_REPO")
         self.runway_dir = os.getenv("RUNWAY_DIR")
         self.artifact_path = os.getenv("ARTIFACT_PATH")
         self.artifact_version = os.getenv("ARTIFACT_VERSION")
@@ -65,17 +84,29 @@ class ForemastRunner:
         self.provider = os.getenv("PROVIDER", "aws")
 
         self.git_project = "{}/{}".format(self.group, self.repo)
-        parsed = foremastutils.Parser(self.git_project)
-        generated = foremastutils.Generator(*parsed.parse_url(), formats=consts.APP_FORMATS)
 
-        self.app = generated.app_name()
-        self.trigger_job = generated.jenkins()['name']
-        self.git_short = generated.gitlab()['main']
-
-        self.raw_path = "./raw.properties"
+        self.raw_path = raw_path
         self.json_path = self.raw_path + ".json"
         self.configs = None
 
+    @property
+    def app(self):
+        """str: Spinnaker application name."""
+        app, _trigger_job, _git_short = generate_names(self.git_project)
+        return app
+
+    @property
+    def trigger_job(self):
+        """str: Jenkins job triggering the pipeline."""
+        _app, trigger_job, _git_short = generate_names(self.git_project)
+        return trigger_job
+
+    @property
+    def git_short(self):
+        """str: Short Git name of the application repository, e.g. forrest/core."""
+        _app, _trigger_job, git_short = generate_names(self.git_project)
+        return git_short
+
     def write_configs(self):
         """Generate the configurations needed for pipes."""
         utils.banner("Generating Configs")
@@ -315,7 +346,11 @@ class ForemastRunner:
 
     def cleanup(self):
         """Clean up generated files."""
-        os.remove(self.raw_path)
+        for path in (self.raw_path, self.raw_path + '.exports', self.json_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                LOG.debug('Generated file %s already removed', path)
 
     def check_env_defined(self):
         """Checks if the current environment is defined in the pipeline files.
@@ -327,6 +362,26 @@ class ForemastRunner:
                                 + "Check pipeline.json and application-master-{}.json".format(self.env))
 
 
+@lru_cache(maxsize=None)
+def generate_names(git_project):
+    """Generate application names for a Git project.
+
+    Results are cached, as :func:`rebuild_pipelines` builds a Runner for
+    every application.
+
+    Args:
+        git_project (str): Git project and repository, e.g. forrest/core.
+
+    Returns:
+        tuple: Spinnaker application name, Jenkins trigger job and short Git
+        name.
+    """
+    parsed = foremastutils.Parser(git_project)
+    generated = foremastutils.Generator(*parsed.parse_url(), formats=consts.APP_FORMATS)
+
+    return generated.app_name(), generated.jenkins()['name'], generated.gitlab()['main']
+
+
 def prepare_infrastructure():
     """Entry point for preparing the infrastructure in a specific env."""
 
@@ -515,23 +570,44 @@ def rebuild_pipelines(*args):
 
     all_apps = utils.get_all_apps()
 
+    rebuild_apps = []
     for apps in all_apps:
         if 'repoProjectKey' not in apps:
             LOG.info('Skipping %s. No project key found', apps['name'])
             continue
 
-        app_name = '{}/{}'.format(apps['repoProjectKey'], apps['repoSlug'])
         if apps['repoProjectKey'].lower() == rebuild_project.lower() or rebuild_all:
-            os.environ["PROJECT"] = apps['repoProjectKey']
-            os.environ["GIT_REPO"] = apps['repoSlug']
-            LOG.info('Rebuilding pipelines for %s', app_name)
-            runner = ForemastRunner()
+            rebuild_apps.append((apps['repoProjectKey'], apps['repoSlug']))
+
+    with ThreadPoolExecutor(max_workers=REBUILD_WORKERS) as executor:
+        futures = {
+            executor.submit(_rebuild_app_pipelines, project, repo): '{}/{}'.format(project, repo)
+            for project, repo in rebuild_apps
+        }
+        for future in as_completed(futures):
             try:
-                runner.write_configs()
-                runner.create_pipeline()
-                runner.cleanup()
+                future.result()
             except Exception:  # pylint: disable=broad-except
-                LOG.warning('Error updating pipeline for %s', app_name)
+                LOG.warning('Error updating pipeline for %s', futures[future])
+
+
+def _rebuild_app_pipelines(project, repo):
+    """Rebuild pipelines for a single application.
+
+    Runs in a worker thread of :func:`rebuild_pipelines`, so the Runner gets
+    its own project, repository and configuration directory instead of
+    sharing environment variables and files with other workers.
+
+    Args:
+        project (str): Git project of the application.
+        repo (str): Git repository of the application.
+    """
+    LOG.info('Rebuilding pipelines for %s/%s', project, repo)
+    with tempfile.TemporaryDirectory() as config_dir:
+        runner = ForemastRunner(group=project, repo=repo, raw_path=os.path.join(config_dir, 'raw.properties'))
+        runner.write_configs()
+        runner.create_pipeline()
+        runner.cleanup()
 
 
 def deploy_awslambda():
@@ -564,6 +640,12 @@ def promote_s3app():
 
 def debug_flag():
     """Set logging level for entry points."""
+    # Only the first call configures logging, later Runners, like those built
+    # per application by rebuild_pipelines, skip the argument parsing
+    global _LOGGING_CONFIGURED  # pylint: disable=global-statement
+    if _LOGGING_CONFIGURED:
+        return
+
     logging.basicConfig(format=consts.LOGGING_FORMAT)
 
     parser = argparse.ArgumentParser(description=debug_flag.__doc__)
@@ -572,3 +654,4 @@ def debug_flag():
 
     package, *_ = __package__.split('.')
     logging.getLogger(package).setLevel(args.debug)
+    _LOGGING_CONFIGURED = True
@@ -18,7 +18,7 @@ import logging
 
 import boto3
 
-from ..utils import get_details
+from ..utils import get_boto3_client, get_details
 
 LOG = logging.getLogger(__name__)
 
@@ -37,8 +37,7 @@ def init_properties(env='dev', app='unnecessary', **_):
         True when application.properties was found.
         False when application.properties needed to be created.
     """
-    aws_env = boto3.session.Session(profile_name=env)
-    s3client = aws_env.resource('s3')
+    s3client = get_boto3_client('s3', env=env)
 
     generated = get_details(app=app, env=env)
     archaius = generated.archaius()
@@ -46,10 +45,10 @@ def init_properties(env='dev', app='unnecessary', **_):
     archaius_file = ('{path}/application.properties').format(path=archaius['path'])
 
     try:
-        s3client.Object(archaius['bucket'], archaius_file).get()
+        s3client.head_object(Bucket=archaius['bucket'], Key=archaius_file)
         LOG.info('Found: %(bucket)s/%(file)s', {'bucket': archaius['bucket'], 'file': archaius_file})
         return True
     except boto3.exceptions.botocore.client.ClientError:
-        s3client.Object(archaius['bucket'], archaius_file).put()
+        s3client.put_object(Bucket=archaius['bucket'], Key=archaius_file)
         LOG.info('Created: %(bucket)s/%(file)s', {'bucket': archaius['bucket'], 'file': archaius_file})
         return False
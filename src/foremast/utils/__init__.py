@@ -16,6 +16,7 @@
 """Package for foremast supporting utilities."""
 from .apps import *
 from .asg import *
+from .aws_clients import get_boto3_client
 from .banners import *
 from .pipelines import *
 from .deep_chain_map import DeepChainMap
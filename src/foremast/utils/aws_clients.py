@@ -0,0 +1,54 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Shared boto3 clients."""
+import logging
+import threading
+from functools import lru_cache
+
+import boto3
+
+LOG = logging.getLogger(__name__)
+
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_boto3_client(service, env=None, region=None):
+    """Get a boto3 client for _service_, reusing one already created.
+
+    Building a Session and loading the service model costs far more than the
+    API calls made with the client, so clients are created once per profile
+    and Region and shared for the life of the process.
+
+    Args:
+        service (str): AWS service name, e.g. elb, iam, route53.
+        env (str): Deployment environment, used as the AWS profile name.
+        region (str): AWS Region, defaults to the Region of the profile.
+
+    Returns:
+        botocore.client.BaseClient: Client for _service_.
+
+    """
+    # boto3 Sessions are not thread safe, clients are
+    with _CLIENT_LOCK:
+        return _create_boto3_client(service, env, region)
+
+
+@lru_cache(maxsize=64)
+def _create_boto3_client(service, env, region):
+    """Create a new boto3 client, see :func:`get_boto3_client`."""
+    LOG.debug('Creating %s client for %s in %s', service, env, region)
+    session = boto3.session.Session(profile_name=env, region_name=region)
+    return session.client(service)
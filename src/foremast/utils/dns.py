@@ -18,12 +18,12 @@ import json
 import logging
 from pprint import pformat
 
-import boto3
 from boto3.exceptions import botocore
 
 from ..consts import DOMAIN
 from ..exceptions import PrimaryDNSRecordNotFound
 from ..utils import get_template
+from .aws_clients import get_boto3_client
 
 LOG = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def get_dns_zone_ids(env='dev', facing='internal'):
         internal.
 
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto3_client('route53', env=env)
 
     zones = client.list_hosted_zones_by_name(DNSName='.'.join([env, DOMAIN]))
 
@@ -68,7 +68,7 @@ def update_dns_zone_record(env, zone_id, **kwargs):
         dns_name_aws (str): FQDN of AWS resource
         dns_ttl (int): DNS time-to-live (ttl)
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto3_client('route53', env=env)
     response = {}
 
     hosted_zone_info = client.get_hosted_zone(Id=zone_id)
@@ -110,7 +110,7 @@ def find_existing_record(env, zone_id, dns_name, check_key=None, check_value=Non
         json: Found Record. Returns None if no record found
 
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto3_client('route53', env=env)
     pager = client.get_paginator('list_resource_record_sets')
     existingrecord = None
     for rset in pager.paginate(HostedZoneId=zone_id):
@@ -134,7 +134,7 @@ def delete_existing_cname(env, zone_id, dns_name):
         zone_id (str): Route53 zone id.
         dns_name (str): FQDN of application's dns entry to add/update.
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto3_client('route53', env=env)
     startrecord = None
     newrecord_name = dns_name
     startrecord = find_existing_record(env, zone_id, newrecord_name, check_key='Type', check_value='CNAME')
@@ -163,7 +163,7 @@ def update_failover_dns_record(env, zone_id, **kwargs):
         failover_state (str): if the record is primary or secondary
         primary_region (str): Primary AWS region for DNS
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto3_client('route53', env=env)
     response = {}
 
     hosted_zone_info = client.get_hosted_zone(Id=zone_id)
@@ -16,11 +16,11 @@
 """Search for ELB DNS name."""
 import logging
 
-import boto3
 from tryagain import retries
 
 from ..exceptions import SpinnakerElbNotFound
 from ..utils.gate import gate_request
+from .aws_clients import get_boto3_client
 
 LOG = logging.getLogger(__name__)
 
@@ -70,6 +70,6 @@ def find_elb_dns_zone_id(name='', env='dev', region='us-east-1'):
 
     """
     LOG.info('Find %s ELB DNS Zone ID in %s [%s].', name, env, region)
-    client = boto3.Session(profile_name=env).client('elb', region_name=region)
+    client = get_boto3_client('elb', env=env, region=region)
     elbs = client.describe_load_balancers(LoadBalancerNames=[name])
     return elbs['LoadBalancerDescriptions'][0]['CanonicalHostedZoneNameID']
@@ -17,6 +17,8 @@
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..consts import API_URL, GATE_AUTHENTICATION, GATE_CA_BUNDLE, GATE_CLIENT_CERT
 from ..exceptions import GoogleIAPTokenError
@@ -25,6 +27,36 @@ from .google_iap import get_google_iap_bearer_token
 LOG = logging.getLogger(__name__)
 OAUTH_ENABLED = False
 
+# Most connections kept open to Gate at once; threads sharing SESSION beyond
+# this many would open extra connections and discard them after each request.
+GATE_POOL_MAXSIZE = 64
+
+
+def _build_session():
+    """Build a pooled Session shared by every Gate API request.
+
+    Reusing one Session keeps connections to Gate alive between calls, so
+    only the first request pays for the TCP and TLS handshakes. Other HTTP
+    lookups, like the AMI JSON table, reuse it as well.
+
+    Only failed connections and reads are retried here. Error statuses are
+    always handed back, so callers like get_subnets and check_task keep
+    checking ``response.ok`` and stay the only retry loop for them.
+
+    Returns:
+        requests.Session: Session with a retrying, pooled adapter mounted.
+    """
+    retries = Retry(total=3, backoff_factor=0.3, respect_retry_after_header=False, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=GATE_POOL_MAXSIZE, max_retries=retries)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+SESSION = _build_session()
+
 
 def gate_request(method='GET', uri=None, headers={}, data={}, params={}):
     """Make a request to Gate's API via various auth methods
@@ -55,11 +87,11 @@ def gate_request(method='GET', uri=None, headers={}, data={}, params={}):
 
     method = method.upper()
     if method == 'GET':
-        response = requests.get(url, params=params, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        response = SESSION.get(url, params=params, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
     elif method == 'POST':
-        response = requests.post(url, data=data, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        response = SESSION.post(url, data=data, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
     elif method == 'DELETE':
-        response = requests.delete(url, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        response = SESSION.delete(url, headers=headers, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
     else:
         raise NotImplementedError
 
@@ -18,12 +18,13 @@ import json
 import logging
 import os
 from base64 import b64decode
+from functools import lru_cache
 
 import gitlab
-import requests
 
 from ..consts import AMI_JSON_URL, GIT_URL, GITLAB_TOKEN
 from ..exceptions import GitLabApiError
+from .gate import SESSION
 from .warn_user import warn_user
 
 LOG = logging.getLogger(__name__)
@@ -59,9 +60,12 @@ def ami_lookup(region='us-east-1', name='tomcat8'):
     return ami_id
 
 
+@lru_cache(maxsize=32)
 def _get_ami_file(region='us-east-1'):
     """Get file from Gitlab.
 
+    Results are cached per _region_ for the life of the process.
+
     Args:
         region (str): AWS Region to find AMI ID.
 
@@ -77,9 +81,13 @@ def _get_ami_file(region='us-east-1'):
     return ami_contents
 
 
+@lru_cache(maxsize=8)
 def _get_ami_dict(json_url):
     """Get ami from a web url.
 
+    Results are cached per _json_url_ for the life of the process, so every
+    Region and base name resolves from a single download.
+
     Args:
         region (str): AWS Region to find AMI ID.
 
@@ -88,7 +96,7 @@ def _get_ami_dict(json_url):
 
     """
     LOG.info("Getting AMI from %s", json_url)
-    response = requests.get(json_url)
+    response = SESSION.get(json_url)
     assert response.ok, "Error getting ami info from {}".format(json_url)
     ami_dict = response.json()
     LOG.debug('AMI json contents: %s', ami_dict)
@@ -16,6 +16,8 @@
 """Get Application properties that have been generated by `create-configs`."""
 import json
 import logging
+import os
+from functools import lru_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -33,10 +35,31 @@ def get_properties(properties_file='raw.properties.json', env=None, region=None)
         None: Given _env_ was not found in `create-configs` JSON output.
 
     """
-    with open(properties_file, 'rt') as file_handle:
-        properties = json.load(file_handle)
+    properties_stat = os.stat(properties_file)
+    properties = json.loads(_read_properties(properties_file, properties_stat.st_mtime_ns, properties_stat.st_size))
 
     env_properties = properties.get(env, properties)
     contents = env_properties.get(region, env_properties)
     LOG.debug('Found properties for %s:\n%s', env, contents)
     return contents
+
+
+@lru_cache(maxsize=8)
+def _read_properties(properties_file, mtime_ns, size):  # pylint: disable=unused-argument
+    """Read _properties_file_, reusing the contents until the file changes.
+
+    The modification time and size are only part of the cache key. The
+    contents are parsed by each caller, as callers update the returned
+    dictionaries.
+
+    Args:
+        properties_file (str): File name of `create-configs` JSON output.
+        mtime_ns (int): Modification time of _properties_file_.
+        size (int): Size of _properties_file_.
+
+    Returns:
+        str: Contents of _properties_file_.
+
+    """
+    with open(properties_file, 'rt') as file_handle:
+        return file_handle.read()
@@ -15,6 +15,7 @@
 #   limitations under the License.
 """Get available Subnets for specific Targets."""
 import logging
+import time
 from collections import defaultdict
 from pprint import pformat
 
@@ -25,6 +26,37 @@ from ..utils.gate import gate_request
 
 LOG = logging.getLogger(__name__)
 
+SUBNET_CACHE_TTL = 300
+_SUBNET_CACHE = {}
+
+
+def _get_subnet_list():
+    """Get all AWS Subnets known to Spinnaker.
+
+    Subnet topology is effectively static for a run, so a successful response
+    is reused for :data:`SUBNET_CACHE_TTL` seconds.
+
+    Returns:
+        list: Subnet dictionaries from Gate.
+
+    Raises:
+        SpinnakerTimeout: Gate did not respond successfully.
+
+    """
+    cached = _SUBNET_CACHE.get('aws')
+    if cached and time.monotonic() - cached[0] < SUBNET_CACHE_TTL:
+        return cached[1]
+
+    uri = '/subnets/aws'
+    subnet_response = gate_request(uri=uri)
+
+    if not subnet_response.ok:
+        raise SpinnakerTimeout(subnet_response.text)
+
+    subnet_list = subnet_response.json()
+    _SUBNET_CACHE['aws'] = (time.monotonic(), subnet_list)
+    return subnet_list
+
 
 # TODO: split up into get_az, and get_subnet_id
 @retries(max_attempts=6, wait=2.0, exceptions=SpinnakerTimeout)  # noqa
@@ -45,13 +77,7 @@ def get_subnets(target='ec2', purpose='internal', env='', region=''): # noqa
     account_az_dict = defaultdict(defaultdict)
     subnet_id_dict = defaultdict(defaultdict)
 
-    uri = '/subnets/aws'
-    subnet_response = gate_request(uri=uri)
-
-    if not subnet_response.ok:
-        raise SpinnakerTimeout(subnet_response.text)
-
-    subnet_list = subnet_response.json()
+    subnet_list = _get_subnet_list()
     for subnet in subnet_list:
         LOG.debug('Subnet Response: %s', subnet)
 
@@ -17,6 +17,7 @@
 import logging
 import os
 import pathlib
+from functools import lru_cache
 
 import jinja2
 
@@ -31,13 +32,30 @@ LOCAL_TEMPLATES = HERE.joinpath('../templates/').resolve()
 
 def get_jinja_environment():
     """Gets the Foremast Jinja environment used for rendering templates
+    Returns:
+        jinja2.Environment
+    """
+    return _build_jinja_environment(TEMPLATES_PATH)
+
+
+@lru_cache(maxsize=4)
+def _build_jinja_environment(templates_path):
+    """Build the Jinja environment for _templates_path_.
+
+    The environment is shared between calls so compiled templates stay in its
+    cache instead of being parsed again for every render.
+
+    Args:
+        templates_path (str): External templates directory, searched before
+            the bundled templates.
+
     Returns:
         jinja2.Environment
     """
     jinja_template_paths_obj = []
 
-    if TEMPLATES_PATH:
-        external_templates = pathlib.Path(TEMPLATES_PATH).expanduser().resolve()
+    if templates_path:
+        external_templates = pathlib.Path(templates_path).expanduser().resolve()
         assert os.path.isdir(external_templates), 'External template path "{0}" not found'.format(external_templates)
         jinja_template_paths_obj.append(external_templates)
 
@@ -14,9 +14,12 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Test ELB creation functions."""
+import copy
 import json
 from unittest import mock
 
+import pytest
+
 from foremast.elb import SpinnakerELB
 from foremast.elb.format_listeners import format_cert_name, format_listeners
 from foremast.elb.splay_health import splay_health
@@ -64,49 +67,44 @@ SAMPLE_TLSCERT_V2_JSON = """{
   }
 }"""
 
-def test_elb_splay():
+@pytest.mark.parametrize('target,expected', [
+    ('HTTP:80/test', ('HTTP', '80', '/test', 'HTTP:80/test')),
+    ('TCP:8000/test', ('TCP', '8000', '', 'TCP:8000')),
+    ('HTTPS:8000/test', ('HTTPS', '8000', '/test', 'HTTPS:8000/test')),
+    ('HTTPS:80', ('HTTPS', '80', '/healthcheck', 'HTTPS:80/healthcheck')),
+])
+def test_elb_splay(target, expected):
     """Splay should split Health Checks properly."""
-    health = splay_health('HTTP:80/test')
-    assert health.path == '/test'
-    assert health.port == '80'
-    assert health.proto == 'HTTP'
-    assert health.target == 'HTTP:80/test'
-
-    health = splay_health('TCP:8000/test')
-    assert health.path == ''
-    assert health.port == '8000'
-    assert health.proto == 'TCP'
-    assert health.target == 'TCP:8000'
-
-    health = splay_health('HTTPS:8000/test')
-    assert health.path == '/test'
-    assert health.port == '8000'
-    assert health.proto == 'HTTPS'
-    assert health.target == 'HTTPS:8000/test'
-
-    health = splay_health('HTTPS:80')
-    assert health.path == '/healthcheck'
-    assert health.port == '80'
-    assert health.proto == 'HTTPS'
-    assert health.target == 'HTTPS:80/healthcheck'
+    health = splay_health(target)
+    assert (health.proto, health.port, health.path, health.target) == expected
+
+
+LISTENER_CONFIG = {
+    'certificate': None,
+    'i_port': 8080,
+    'i_proto': 'HTTP',
+    'lb_port': 80,
+    'lb_proto': 'HTTP',
+    'policies': [],
+    'listener_policies': [],
+    'backend_policies': [],
+}
 
+HTTP_500_PORT = {'instance': 'HTTP:8000', 'loadbalancer': 'http:500'}
+HTTP_500_LISTENER = {
+    'externalPort': 500,
+    'externalProtocol': 'HTTP',
+    'internalPort': 8000,
+    'internalProtocol': 'HTTP',
+    'sslCertificateId': None,
+    'listenerPolicies': [],
+    'backendPolicies': [],
+}
 
-@mock.patch('foremast.elb.format_listeners.get_env_credential')
-def test_elb_format_listeners(mock_creds):
-    """Listeners should be formatted in list of dicts."""
-    mock_creds.return_value = {'accountId': '0100'}
 
-    config = {
-        'certificate': None,
-        'i_port': 8080,
-        'i_proto': 'HTTP',
-        'lb_port': 80,
-        'lb_proto': 'HTTP',
-        'policies': [],
-        'listener_policies': [],
-        'backend_policies': [],
-    }
-    generated = [{
+@pytest.mark.parametrize('ports,expected', [
+    # check defaults
+    (None, [{
         'externalPort': 80,
         'externalProtocol': 'HTTP',
         'internalPort': 8080,
@@ -114,32 +112,15 @@ def test_elb_format_listeners(mock_creds):
         'sslCertificateId': None,
         'listenerPolicies': [],
         'backendPolicies': [],
-    }]
-
-    # check defaults
-    assert generated == format_listeners(elb_settings=config)
-
+    }]),
     # 'ports' key should override old style definitions
-    config['ports'] = [{'instance': 'HTTP:8000', 'loadbalancer': 'http:500'}]
-    generated = [{
-        'externalPort': 500,
-        'externalProtocol': 'HTTP',
-        'internalPort': 8000,
-        'internalProtocol': 'HTTP',
-        'sslCertificateId': None,
-        'listenerPolicies': [],
-        'backendPolicies': [],
-    }]
-
-    # check ports
-    assert generated == format_listeners(elb_settings=config)
-
-    config['ports'].append({
+    ([HTTP_500_PORT], [HTTP_500_LISTENER]),
+    # check certificate
+    ([HTTP_500_PORT, {
         'certificate': 'kerby',
         'instance': 'http:80',
         'loadbalancer': 'https:443',
-    })
-    generated.append({
+    }], [HTTP_500_LISTENER, {
         'externalPort': 443,
         'externalProtocol': 'HTTPS',
         'internalPort': 80,
@@ -147,10 +128,18 @@ def test_elb_format_listeners(mock_creds):
         'sslCertificateId': 'arn:aws:iam::0100:server-certificate/kerby',
         'listenerPolicies': [],
         'backendPolicies': [],
-    })
+    }]),
+])
+@mock.patch('foremast.elb.format_listeners.get_env_credential')
+def test_elb_format_listeners(mock_creds, ports, expected):
+    """Listeners should be formatted in list of dicts."""
+    mock_creds.return_value = {'accountId': '0100'}
 
-    # check certificate
-    assert generated == format_listeners(elb_settings=config)
+    config = copy.deepcopy(LISTENER_CONFIG)
+    if ports is not None:
+        config['ports'] = copy.deepcopy(ports)
+
+    assert expected == format_listeners(elb_settings=config)
 
 
 def test_elb_format_cert_name():
@@ -249,9 +238,9 @@ def test_elb_make_elb_json(mock_get_properties, mock_get_subnets, mock_format_li
     assert not elb_json['job'][0]['isInternal']
 
 
-@mock.patch('foremast.elb.create_elb.boto3.session.Session')
+@mock.patch('foremast.elb.create_elb.get_boto3_client')
 @mock.patch('foremast.elb.create_elb.get_properties')
-def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
+def test_elb_add_listener_policy(mock_get_properties, mock_boto3_client):
     test_app = 'myapp'
     test_port = 80
     test_policy_list = ['policy_name']
@@ -266,7 +255,7 @@ def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
             ],
         }],
     }
-    client = mock_boto3_session.return_value.client.return_value
+    client = mock_boto3_client.return_value
 
     elb = SpinnakerELB(app='myapp', env='dev', region='us-east-1')
     elb.add_listener_policy(json.dumps(json_data))
@@ -274,9 +263,9 @@ def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
         LoadBalancerName=test_app, LoadBalancerPort=test_port, PolicyNames=test_policy_list)
 
 
-@mock.patch('foremast.elb.create_elb.boto3.session.Session')
+@mock.patch('foremast.elb.create_elb.get_boto3_client')
 @mock.patch('foremast.elb.create_elb.get_properties')
-def test_elb_add_backend_policy(mock_get_properties, mock_boto3_session):
+def test_elb_add_backend_policy(mock_get_properties, mock_boto3_client):
     test_app = 'myapp'
     test_port = 80
     test_policy_list = ['policy_name']
@@ -291,7 +280,7 @@ def test_elb_add_backend_policy(mock_get_properties, mock_boto3_session):
             ],
         }],
     }
-    client = mock_boto3_session.return_value.client.return_value
+    client = mock_boto3_client.return_value
 
     elb = SpinnakerELB(app='myapp', env='dev', region='us-east-1')
     elb.add_backend_policy(json.dumps(json_data))
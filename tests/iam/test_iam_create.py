@@ -25,12 +25,12 @@ LAMBDA_TEMPLATE_NAME = 'infrastructure/iam/trust/lambda_role.json.j2'
 
 
 @mock.patch('foremast.iam.create_iam.attach_profile_to_role')
-@mock.patch('foremast.iam.create_iam.boto3.session.Session')
+@mock.patch('foremast.iam.create_iam.get_boto3_client')
 @mock.patch('foremast.iam.create_iam.construct_policy')
 @mock.patch('foremast.iam.create_iam.get_details')
 @mock.patch('foremast.iam.create_iam.get_properties')
 @mock.patch('foremast.iam.create_iam.resource_action')
-def test_create_iam_resources(resource_action, get_properties, get_details, construct_policy, session,
+def test_create_iam_resources(resource_action, get_properties, get_details, construct_policy, get_boto3_client,
                               attach_profile_to_role):
     """Check basic functionality."""
     get_details.return_value.iam.return_value = {'group': 1, 'policy': 2, 'profile': 3, 'role': 4, 'user': 5}
@@ -39,7 +39,7 @@ def test_create_iam_resources(resource_action, get_properties, get_details, cons
     assert create_iam_resources(env='narnia', app='lion/aslan')
 
     assert resource_action.call_count == 6
-    session.assert_called_with(profile_name='narnia')
+    get_boto3_client.assert_called_with('iam', env='narnia')
     get_details.assert_called_with(env='narnia', app='lion/aslan')
     get_properties.assert_called_with(env='pipeline')
     construct_policy.assert_called_with(
@@ -47,13 +47,13 @@ def test_create_iam_resources(resource_action, get_properties, get_details, cons
 
 
 @mock.patch('foremast.iam.create_iam.attach_profile_to_role')
-@mock.patch('foremast.iam.create_iam.boto3.session.Session')
+@mock.patch('foremast.iam.create_iam.get_boto3_client')
 @mock.patch('foremast.iam.create_iam.construct_policy')
 @mock.patch('foremast.iam.create_iam.get_details')
 @mock.patch('foremast.iam.create_iam.get_properties')
 @mock.patch('foremast.iam.create_iam.get_template')
 @mock.patch('foremast.iam.create_iam.resource_action')
-def test_iam_role_policy(resource_action, get_template, get_properties, get_details, construct_policy, session,
+def test_iam_role_policy(resource_action, get_template, get_properties, get_details, construct_policy, get_boto3_client,
                          attach_profile_to_role):
     """IAM Role Policy should match deployment type."""
     get_properties.return_value = {'type': 'ec2'}
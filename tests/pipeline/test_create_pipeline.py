@@ -14,9 +14,13 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Test create_pipeline functionality"""
+import json
 from unittest import mock
 
+import foremastutils
 import pytest
+from foremast.consts import APP_FORMATS
+from foremast.exceptions import SpinnakerPipelineCreationFailed
 from foremast.pipeline import SpinnakerPipeline
 
 TEST_FORMAT_GENERATOR = mock.Mock()
@@ -65,13 +69,13 @@ def spinnaker_pipeline(mock_os, mock_get_details, mock_get_prop):
 
 
 @mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
+@mock.patch.object(SpinnakerPipeline, '_region_generator', return_value=TEST_FORMAT_GENERATOR)
 @mock.patch.object(SpinnakerPipeline, 'render_wrapper')
 @mock.patch('foremast.pipeline.create_pipeline.get_subnets')
 @mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
-@mock.patch('foremast.pipeline.create_pipeline.renumerate_stages')
 @mock.patch.object(SpinnakerPipeline, 'post_pipeline')
-def test_create_pipeline_ec2(mock_post, mock_renumerate, mock_construct, mock_subnets, mock_wrapper, mock_clean,
-                             spinnaker_pipeline):
+def test_create_pipeline_ec2(mock_post, mock_construct, mock_subnets, mock_wrapper, mock_generator,
+                             mock_clean, spinnaker_pipeline):
     """test pipeline creation if ec2 pipeline."""
     test_block_data = {
         "env": "dev",
@@ -85,11 +89,138 @@ def test_create_pipeline_ec2(mock_post, mock_renumerate, mock_construct, mock_su
         }
     }
     mock_subnets.return_value = {'dev': {'us-east-1': ['us-east-1d', 'us-east-1a', 'us-east-1e']}}
-    mock_construct.return_value = '{"test": "stuff"}'
-    mock_wrapper.return_value = {'stages': []}
+    mock_construct.return_value = '[{"refId": "master"}, {"refId": "branch"}]'
+    mock_wrapper.return_value = {'stages': [{'refId': 'master'}]}
     created = spinnaker_pipeline.create_pipeline()
 
     mock_construct.assert_called_with(**test_block_data)
-    mock_post.assert_called_with({'stages': ['test']})
+    mock_post.assert_called_with({
+        'stages': [
+            {'refId': '1', 'requisiteStageRefIds': []},
+            {'refId': '2', 'requisiteStageRefIds': ['1']},
+            {'refId': '200', 'requisiteStageRefIds': ['2']},
+        ]
+    })
 
     assert created == True
+
+
+@mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
+@mock.patch.object(SpinnakerPipeline, '_region_generator', return_value=TEST_FORMAT_GENERATOR)
+@mock.patch.object(SpinnakerPipeline, 'render_wrapper')
+@mock.patch('foremast.pipeline.create_pipeline.get_subnets')
+@mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
+@mock.patch.object(SpinnakerPipeline, 'post_pipeline')
+def test_create_pipeline_per_region(mock_post, mock_construct, mock_subnets, mock_wrapper, mock_generator, mock_clean,
+                                    spinnaker_pipeline):
+    """test one pipeline is posted per region."""
+    regions = ['us-east-1', 'us-west-2']
+    spinnaker_pipeline.settings = {
+        'dev': dict(TEST_SETTINGS['dev'], regions=regions, **{'us-west-2': TEST_SETTINGS['dev']['us-east-1']}),
+        'pipeline': TEST_SETTINGS['pipeline'],
+    }
+    mock_subnets.return_value = {'dev': {region: ['{0}a'.format(region)] for region in regions}}
+    mock_construct.return_value = '[{"refId": "master"}]'
+    mock_wrapper.side_effect = lambda region, generated: {'name': region, 'stages': []}
+
+    assert spinnaker_pipeline.create_pipeline()
+
+    posted = sorted(call[0][0]['name'] for call in mock_post.call_args_list)
+    assert posted == regions
+
+
+@mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
+@mock.patch.object(SpinnakerPipeline, '_region_generator', return_value=TEST_FORMAT_GENERATOR)
+@mock.patch.object(SpinnakerPipeline, 'render_wrapper')
+@mock.patch('foremast.pipeline.create_pipeline.get_subnets')
+@mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
+@mock.patch.object(SpinnakerPipeline, 'post_pipeline')
+def test_create_pipeline_region_failure(mock_post, mock_construct, mock_subnets, mock_wrapper, mock_generator,
+                                        mock_clean, spinnaker_pipeline):
+    """test a failing region is reported after the other regions are posted."""
+    regions = ['us-east-1', 'us-west-2']
+    spinnaker_pipeline.settings = {
+        'dev': dict(TEST_SETTINGS['dev'], regions=regions, **{'us-west-2': TEST_SETTINGS['dev']['us-east-1']}),
+        'pipeline': TEST_SETTINGS['pipeline'],
+    }
+    mock_subnets.return_value = {'dev': {region: ['{0}a'.format(region)] for region in regions}}
+    mock_wrapper.side_effect = lambda region, generated: {'name': region, 'stages': []}
+
+    def construct(**kwargs):
+        if kwargs['region'] == 'us-west-2':
+            raise ValueError('bad block')
+        return '[{"refId": "master"}]'
+
+    mock_construct.side_effect = construct
+
+    with pytest.raises(SpinnakerPipelineCreationFailed, match='us-west-2'):
+        spinnaker_pipeline.create_pipeline()
+
+    posted = [call[0][0]['name'] for call in mock_post.call_args_list]
+    assert posted == ['us-east-1']
+
+
+@mock.patch('foremast.pipeline.create_pipeline.get_template')
+@mock.patch('foremast.pipeline.create_pipeline.ami_lookup')
+@mock.patch.object(SpinnakerPipeline, 'compare_with_existing')
+@mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
+@mock.patch.object(SpinnakerPipeline, 'post_pipeline')
+def test_build_region_wrapper_formats(mock_post, mock_construct, mock_compare, mock_ami, mock_template,
+                                      spinnaker_pipeline):
+    """test the wrapper renders with the naming formats of its own region."""
+    spinnaker_pipeline.generated = foremastutils.Generator(
+        'group', 'app', env='dev', region='us-east-1', formats=APP_FORMATS)
+    spinnaker_pipeline.settings = {
+        'dev': {'us-west-2': {}},
+        'pipeline': dict(TEST_SETTINGS['pipeline'], type='lambda', notifications={'email': '', 'slack': ''},
+                         image=dict(TEST_SETTINGS['pipeline']['image'], bake_instance_type='t2.small')),
+    }
+    mock_construct.return_value = '[]'
+    mock_template.return_value = '{"stages": []}'
+
+    spinnaker_pipeline._build_and_post_region('us-west-2', ['dev'])
+
+    _, kwargs = mock_template.call_args
+    assert kwargs['formats'].data['region'] == 'us-west-2'
+    assert spinnaker_pipeline.generated.data['region'] == 'us-east-1'
+
+
+def test_region_generator(spinnaker_pipeline):
+    """test Region generator keeps the base naming data with Region swapped."""
+    spinnaker_pipeline.generated = foremastutils.Generator(
+        'group', 'app', env='dev', region='us-east-1', formats=APP_FORMATS)
+
+    generated = spinnaker_pipeline._region_generator('us-west-2')
+
+    assert generated.data == dict(spinnaker_pipeline.generated.data, region='us-west-2')
+    assert spinnaker_pipeline.generated.data['region'] == 'us-east-1'
+
+
+@mock.patch('foremast.pipeline.create_pipeline.gate_request')
+def test_post_pipeline_dict(mock_gate_request, spinnaker_pipeline):
+    """test a pipeline dict is serialized once and posted."""
+    pipeline = {'name': 'appgroup [us-east-1]', 'application': 'appgroup', 'stages': []}
+
+    spinnaker_pipeline.post_pipeline(pipeline)
+
+    _, kwargs = mock_gate_request.call_args
+    assert json.loads(kwargs['data']) == pipeline
+    assert ', ' not in kwargs['data']
+
+
+@mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
+@mock.patch.object(SpinnakerPipeline, '_region_generator', return_value=TEST_FORMAT_GENERATOR)
+@mock.patch.object(SpinnakerPipeline, 'render_wrapper')
+@mock.patch('foremast.pipeline.create_pipeline.get_subnets')
+@mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
+@mock.patch.object(SpinnakerPipeline, 'post_pipeline')
+def test_create_pipeline_env_unavailable(mock_post, mock_construct, mock_subnets, mock_wrapper, mock_generator,
+                                         mock_clean, spinnaker_pipeline):
+    """test environments without subnets in a region are skipped."""
+    mock_subnets.return_value = {'dev': {'us-west-2': ['us-west-2a']}}
+    mock_wrapper.return_value = {'stages': []}
+
+    assert spinnaker_pipeline.create_pipeline()
+
+    mock_construct.assert_not_called()
+    mock_post.assert_called_with({'stages': []})
@@ -1,5 +1,5 @@
 """Test Stage renumerate logic."""
-from foremast.pipeline.renumerate_stages import renumerate_stages
+from foremast.pipeline.renumerate_stages import StageRenumerator, renumerate_stages
 
 
 def test_basic():
@@ -118,3 +118,17 @@ def test_branches():
     }
 
     assert renumerate_stages(pipeline) == answer
+
+
+def test_incremental_blocks():
+    """Test numbering blocks as they are added matches numbering the whole Pipeline."""
+    refids = ['master', 'master', 'branch', 'branch', 'master', 'branch', 'master']
+
+    whole = renumerate_stages({'stages': [{'refId': refid} for refid in refids]})
+
+    renumerator = StageRenumerator()
+    stages = []
+    for block in (refids[:1], refids[1:4], refids[4:]):
+        stages.extend(renumerator.renumerate([{'refId': refid} for refid in block]))
+
+    assert stages == whole['stages']
@@ -0,0 +1,22 @@
+"""Test Archaius application.properties creation."""
+from unittest import mock
+
+import boto3
+
+from foremast.s3 import init_properties
+
+
+@mock.patch('foremast.s3.create_archaius.get_details')
+@mock.patch('foremast.s3.create_archaius.get_boto3_client')
+def test_init_properties(mock_client, mock_details):
+    """Existing properties are found, missing ones are created."""
+    mock_details.return_value.archaius.return_value = {'bucket': 'archaius', 'path': 'app'}
+    s3client = mock_client.return_value
+
+    assert init_properties(env='dev', app='app') is True
+    mock_client.assert_called_with('s3', env='dev')
+    s3client.put_object.assert_not_called()
+
+    s3client.head_object.side_effect = boto3.exceptions.botocore.client.ClientError({}, 'HeadObject')
+    assert init_properties(env='dev', app='app') is False
+    s3client.put_object.assert_called_once_with(Bucket='archaius', Key='app/application.properties')
@@ -19,6 +19,7 @@ from unittest import mock
 
 import pytest
 from foremast.utils import ami_lookup
+from foremast.utils.lookups import _get_ami_dict, _get_ami_file
 
 
 @mock.patch('foremast.utils.lookups.GITLAB_TOKEN', new=True)
@@ -53,6 +54,46 @@ def test_dict_lookup(ami_file_dict):
     assert ami_lookup(region='us-west-2', name='tomcat8') == 'ami-yyyy'
 
 
+@pytest.fixture
+def clear_ami_cache():
+    """Start and finish with empty AMI lookup caches."""
+    _get_ami_dict.cache_clear()
+    _get_ami_file.cache_clear()
+    yield
+    _get_ami_dict.cache_clear()
+    _get_ami_file.cache_clear()
+
+
+@mock.patch('foremast.utils.lookups.AMI_JSON_URL', new='http://ami.example.com/ami.json')
+@mock.patch('foremast.utils.lookups.SESSION')
+def test_dict_lookup_cached(mock_session, clear_ami_cache):
+    """AMI json url is fetched once for every Region and name."""
+    mock_session.get.return_value.json.return_value = {
+        'us-east-1': {
+            'base_fedora': 'ami-xxxx',
+        },
+        'us-west-2': {
+            'tomcat8': 'ami-yyyy',
+        }
+    }
+    assert ami_lookup(region='us-east-1', name='base_fedora') == 'ami-xxxx'
+    assert ami_lookup(region='us-west-2', name='tomcat8') == 'ami-yyyy'
+
+    mock_session.get.assert_called_once_with('http://ami.example.com/ami.json')
+
+
+@mock.patch('foremast.utils.lookups.GITLAB_TOKEN', new=True)
+@mock.patch('foremast.utils.lookups.FileLookup')
+def test_ami_lookup_cached(mock_lookup, clear_ami_cache):
+    """AMI file is fetched from GitLab once per Region."""
+    mock_lookup.return_value.remote_file.return_value = json.dumps({'base_fedora': 'ami-xxxx', 'tomcat8': 'ami-yyyy'})
+    with pytest.warns(UserWarning):
+        assert ami_lookup(name='base_fedora') == 'ami-xxxx'
+        assert ami_lookup(name='tomcat8') == 'ami-yyyy'
+
+    mock_lookup.return_value.remote_file.assert_called_once_with(filename='scripts/us-east-1.json', branch='master')
+
+
 def test_no_external_lookup():
     """AMI lookup not using json or gitlab."""
     assert ami_lookup(region='us-east-1', name='no_external') == 'no_external'
@@ -19,7 +19,9 @@ from unittest import mock
 
 import pytest
 
-from foremast.runner import ForemastRunner
+from foremast.pipeline.create_pipeline import MAX_REGION_WORKERS
+from foremast.runner import REBUILD_WORKERS, ForemastRunner, rebuild_pipelines
+from foremast.utils.gate import GATE_POOL_MAXSIZE
 from foremast.pipeline import SpinnakerPipeline
 
 CONFIGS = {
@@ -58,3 +60,55 @@ def test_runner_create_pipeline_onetime(mock_pipelines):
     runner.configs = CONFIGS
     runner.configs['pipeline']['type'] = 'manual'
     runner.create_pipeline(onetime=True)
+
+
+@mock.patch('foremast.runner._rebuild_app_pipelines')
+@mock.patch('foremast.runner.utils.get_all_apps')
+def test_runner_rebuild_pipelines_project(mock_all_apps, mock_rebuild):
+    """Test rebuild continues past failing apps and skips other projects."""
+    mock_all_apps.return_value = [
+        {'name': 'group1repo1', 'repoProjectKey': 'group1', 'repoSlug': 'repo1'},
+        {'name': 'group1repo2', 'repoProjectKey': 'group1', 'repoSlug': 'repo2'},
+        {'name': 'group2repo1', 'repoProjectKey': 'group2', 'repoSlug': 'repo1'},
+        {'name': 'noproject'},
+    ]
+    mock_rebuild.side_effect = [Exception('failed'), None]
+
+    with mock.patch.dict(os.environ, {'REBUILD_PROJECT': 'group1'}):
+        rebuild_pipelines()
+
+    rebuilt = sorted(call[0] for call in mock_rebuild.call_args_list)
+    assert rebuilt == [('group1', 'repo1'), ('group1', 'repo2')]
+
+
+def test_runner_rebuild_workers_fit_gate_pool():
+    """Test nested rebuild and Region workers never outgrow the Gate pool."""
+    assert REBUILD_WORKERS * MAX_REGION_WORKERS <= GATE_POOL_MAXSIZE
+
+
+def test_runner_cleanup(tmpdir):
+    """Test generated files are removed, even when some are missing."""
+    raw_path = tmpdir.join('raw.properties')
+    exports_path = tmpdir.join('raw.properties.exports')
+    raw_path.write('')
+    exports_path.write('')
+
+    runner = ForemastRunner(raw_path=str(raw_path))
+    runner.cleanup()
+
+    assert not raw_path.check()
+    assert not exports_path.check()
+
+
+@mock.patch('foremast.runner.generate_names')
+def test_runner_names_lazy(mock_generate_names):
+    """Test application names are only generated when used."""
+    mock_generate_names.return_value = ('repo1group1', 'group1_repo1', 'group1/repo1')
+
+    runner = ForemastRunner()
+    mock_generate_names.assert_not_called()
+
+    assert runner.app == 'repo1group1'
+    assert runner.trigger_job == 'group1_repo1'
+    assert runner.git_short == 'group1/repo1'
+    mock_generate_names.assert_called_with('group1/repo1')
@@ -15,12 +15,14 @@
 #   limitations under the License.
 """Test utils."""
 
+import json
 from unittest import mock
 
 import pytest
 
 from foremast.exceptions import *
 from foremast.utils import *
+from foremast.utils import subnets
 
 
 @mock.patch('foremast.utils.banners.LOG')
@@ -154,9 +156,9 @@ def test_utils_apps_get_all_apps(mock_gate_request):
         result = get_all_apps()
 
 
-@mock.patch('foremast.utils.dns.boto3.Session')
+@mock.patch('foremast.utils.dns.get_boto3_client')
 @mock.patch('foremast.utils.dns.DOMAIN', 'test')
-def test_utils_dns_get_zone_ids(mock_boto3):
+def test_utils_dns_get_zone_ids(mock_client):
     data = {
         'HostedZones': [
             {
@@ -195,7 +197,7 @@ def test_utils_dns_get_zone_ids(mock_boto3):
         ]
     }
 
-    mock_boto3.return_value.client.return_value.list_hosted_zones_by_name.return_value = data
+    mock_client.return_value.list_hosted_zones_by_name.return_value = data
 
     # default case
     result = get_dns_zone_ids()
@@ -214,7 +216,7 @@ def test_utils_dns_get_zone_ids(mock_boto3):
     assert result == [100]
 
     # no internal zones
-    mock_boto3.return_value.client.return_value.list_hosted_zones_by_name.return_value = data_external
+    mock_client.return_value.list_hosted_zones_by_name.return_value = data_external
     result = get_dns_zone_ids(facing='internal')
     assert result == []
 
@@ -223,8 +225,8 @@ def test_utils_dns_get_zone_ids(mock_boto3):
     assert result == []
 
 
-@mock.patch('foremast.utils.dns.boto3.Session')
-def test_find_existing_record(mock_session):
+@mock.patch('foremast.utils.dns.get_boto3_client')
+def test_find_existing_record(mock_client):
     """Check that a record is found correctly"""
 
     dns_values = {'env': 'dev', 'zone_id': '/hostedzone/TESTTESTS279', 'dns_name': 'test.example.com'}
@@ -244,7 +246,7 @@ def test_find_existing_record(mock_session):
             'Type': 'A'
         }]
     }]
-    client = mock_session.return_value.client.return_value
+    client = mock_client.return_value
     client.get_paginator.return_value.paginate.return_value = test_records
     assert find_existing_record(
         dns_values['env'], dns_values['zone_id'], dns_values['dns_name'], check_key='Type', check_value='CNAME') == {
@@ -331,6 +333,12 @@ SUBNET_DATA = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_subnet_cache():
+    """Start every test without cached Subnets."""
+    subnets._SUBNET_CACHE.clear()
+
+
 @mock.patch('foremast.utils.subnets.gate_request')
 def test_utils_subnets_get_subnets(mock_gate_request):
     """Find one subnet."""
@@ -378,6 +386,18 @@ def test_utils_subnets_get_subnets_api_error(mock_gate_request):
         result = get_subnets()
 
 
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_get_subnets_cached(mock_gate_request):
+    """Reuse the Gate response for repeated lookups."""
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
+
+    first = get_subnets(env='dev', region='')
+    second = get_subnets(env='dev', region='')
+
+    assert first == second
+    assert mock_gate_request.call_count == 1
+
+
 @mock.patch('foremast.utils.tasks.check_task')
 @mock.patch('foremast.utils.tasks.post_task')
 @mock.patch('foremast.utils.tasks.TASK_TIMEOUTS')
@@ -401,3 +421,25 @@ def test_utils_default_timeout(mock_check_task, mock_requests_post, mock_timeout
     mock_timeouts.side_effect = {"dev": {"fake_task": "240"}}
     tasks.wait_for_task(task_data)
     assert mock_check_task.called_with("really_fake_task", tasks.DEFAULT_TASK_TIMEOUT)
+
+
+def test_utils_templates_environment_reused():
+    """Compiled templates are shared between renders."""
+    assert get_jinja_environment() is get_jinja_environment()
+    assert get_template_object('pipeline/pipeline_wrapper.json.j2') is get_template_object(
+        'pipeline/pipeline_wrapper.json.j2')
+
+
+def test_utils_get_properties_reloads_changed_file(tmpdir):
+    """Properties are read again once the file changes."""
+    properties_file = tmpdir.join('raw.properties.json')
+    properties_file.write(json.dumps({'dev': {'us-east-1': {'app': 'first'}}}))
+
+    properties = get_properties(str(properties_file), env='dev', region='us-east-1')
+    assert properties == {'app': 'first'}
+
+    properties['app'] = 'changed by caller'
+    assert get_properties(str(properties_file), env='dev', region='us-east-1') == {'app': 'first'}
+
+    properties_file.write(json.dumps({'dev': {'us-east-1': {'app': 'second, rewritten'}}}))
+    assert get_properties(str(properties_file), env='dev', region='us-east-1') == {'app': 'second, rewritten'}
@@ -0,0 +1,20 @@
+"""Test shared boto3 clients."""
+from unittest import mock
+
+from foremast.utils.aws_clients import _create_boto3_client, get_boto3_client
+
+
+@mock.patch('foremast.utils.aws_clients.boto3.session.Session')
+def test_get_boto3_client_reused(mock_session):
+    """Clients are created once per service, profile and Region."""
+    _create_boto3_client.cache_clear()
+
+    first = get_boto3_client('elb', env='dev', region='us-east-1')
+    second = get_boto3_client('elb', env='dev', region='us-east-1')
+    get_boto3_client('elb', env='dev', region='us-west-2')
+
+    assert first is second
+    assert mock_session.call_count == 2
+    mock_session.assert_any_call(profile_name='dev', region_name='us-east-1')
+
+    _create_boto3_client.cache_clear()
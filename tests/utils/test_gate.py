@@ -0,0 +1,78 @@
+"""Test Gate API request helper."""
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest import mock
+
+import pytest
+
+from foremast.utils import gate
+from foremast.utils.gate import gate_request
+
+
+class ThreadedServer(ThreadingMixIn, HTTPServer):
+    """Serve each kept-alive connection on its own thread."""
+    daemon_threads = True
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """Answer every GET with the server's status and record the client."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.clients.append(self.client_address)
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Local HTTP server for exercising the real Session adapter."""
+    server = ThreadedServer(('127.0.0.1', 0), StatusHandler)
+    server.clients = []
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_gate_session_reuses_connection(local_server):
+    """Consecutive requests share one kept-alive connection."""
+    url = 'http://127.0.0.1:{}/'.format(local_server.server_port)
+
+    gate.SESSION.get(url)
+    gate.SESSION.get(url)
+
+    assert len(local_server.clients) == 2
+    assert len(set(local_server.clients)) == 1
+
+
+def test_gate_session_returns_error_status(local_server):
+    """A 503 is returned once, leaving status retries to the caller."""
+    local_server.status = 503
+    url = 'http://127.0.0.1:{}/'.format(local_server.server_port)
+
+    response = gate.SESSION.get(url)
+
+    assert response.status_code == 503
+    assert response.ok is False
+    assert len(local_server.clients) == 1
+
+
+@mock.patch('foremast.utils.gate.SESSION')
+def test_gate_request_reuses_session(mock_session):
+    """Every method goes through the shared Session."""
+    mock_session.get.return_value.status_code = 200
+    mock_session.post.return_value.status_code = 200
+
+    gate_request(uri='/applications')
+    gate_request(method='POST', uri='/pipelines', data='{}')
+
+    assert mock_session.get.call_count == 1
+    assert mock_session.post.call_count == 1